@@ -0,0 +1,68 @@
+"""Sanity check for the scheduling algorithm.
+
+Generates random rosters, runs the scheduler and verifies that every
+schedule respects the business rules:
+
+    python check_invariants.py
+"""
+import contextlib
+import io
+import random
+
+from employee import Employee, MAX_EMPLOYEES_PER_SHIFT, MAX_WORK_DAYS_PER_WEEK
+from scheduler import Scheduler
+
+def build_scheduler(rng: random.Random, employee_count: int) -> Scheduler:
+    """Creates a scheduler with randomly generated shift preferences"""
+    scheduler = Scheduler()
+    for i in range(employee_count):
+        employee = Employee(f"Employee{i}")
+        for day in scheduler.days:
+            choice = rng.randrange(len(scheduler.shifts) + 1)
+            if choice < len(scheduler.shifts):
+                employee.set_preference(day, scheduler.shifts[choice])
+        scheduler.employees.append(employee)
+    return scheduler
+
+def check_schedule(scheduler: Scheduler) -> None:
+    """Asserts that the employee schedules and the shift grid agree and respect the rules"""
+    for employee in scheduler.employees:
+        assigned_days = [day for day in scheduler.days if employee.get_assigned_shift(day) is not None]
+        assert employee.days_worked == len(assigned_days), f"{employee.name}: days_worked out of sync"
+        assert employee.days_worked <= MAX_WORK_DAYS_PER_WEEK, f"{employee.name}: works too many days"
+
+    for day in scheduler.days:
+        for shift in scheduler.shifts:
+            names = scheduler.schedule[day][shift]
+            assert len(names) <= MAX_EMPLOYEES_PER_SHIFT, f"day {day} {shift.name}: overstaffed"
+            # The scheduler's internal staff counts must track the name lists
+            assert scheduler._counts[day * len(scheduler.shifts) + shift] == len(names), f"day {day} {shift.name}: count out of sync"
+            assert len(names) == len(set(names)), f"day {day} {shift.name}: duplicate employee"
+            for name in names:
+                employee = next(emp for emp in scheduler.employees if emp.name == name)
+                assert employee.get_assigned_shift(day) == shift, f"{name}: grid and schedule disagree"
+
+        # At most one shift per employee per day
+        names_today = [name for shift in scheduler.shifts for name in scheduler.schedule[day][shift]]
+        assert len(names_today) == len(set(names_today)), f"day {day}: employee on two shifts"
+
+    total = sum(len(names) for day_schedule in scheduler.schedule for names in day_schedule)
+    assert total == sum(emp.days_worked for emp in scheduler.employees), "grid and schedules disagree"
+
+def main() -> None:
+    runs = 0
+    for seed in range(100):
+        rng = random.Random(seed)
+        random.seed(seed)
+        for employee_count in (0, 1, 3, 5, 8, 10, 20, 40):
+            scheduler = build_scheduler(rng, employee_count)
+            with contextlib.redirect_stdout(io.StringIO()):
+                scheduler.assign_shifts()
+                scheduler.assign_shifts()  # regenerating must start from a clean slate
+                scheduler.print_schedule()
+            check_schedule(scheduler)
+            runs += 1
+    print(f"✅ All {runs} generated schedules passed the invariant checks")
+
+if __name__ == "__main__":
+    main()
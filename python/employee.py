@@ -1,21 +1,24 @@
-from enum import Enum
-from typing import Dict, Optional
+from enum import IntEnum
+from typing import Optional, Tuple
 
-class Shift(Enum):
-    MORNING = "Morning"
-    AFTERNOON = "Afternoon"
-    EVENING = "Evening"
+class Shift(IntEnum):
+    MORNING = 0
+    AFTERNOON = 1
+    EVENING = 2
 
     def _get_shift_icon(self) -> str:
         """Returns an emoji icon for a given shift"""
-        if self == Shift.MORNING:
-            return "🌅"
-        elif self == Shift.AFTERNOON:
-            return "☀️"
-        elif self == Shift.EVENING:
-            return "🌙"
-        else:
-            return "❓"
+        return SHIFT_ICONS.get(self, "❓")
+
+# Display icons, looked up by shift and by days worked (0-5)
+SHIFT_ICONS = {Shift.MORNING: "🌅", Shift.AFTERNOON: "☀️", Shift.EVENING: "🌙"}
+_WORKLOAD_ICONS = ("😴", "😌", "😌", "😊", "😊", "💪")
+
+# Display names, indexed by shift
+SHIFT_NAMES = ("Morning", "Afternoon", "Evening")
+
+# Per-day codes stored in the Employee byte arrays are shift + 1 (0 = no shift)
+_CODE_TO_SHIFT: Tuple[Optional[Shift], ...] = (None, Shift.MORNING, Shift.AFTERNOON, Shift.EVENING)
 
 # Scheduling constraints
 MIN_EMPLOYEES_PER_SHIFT = 2
@@ -23,93 +26,91 @@ MAX_EMPLOYEES_PER_SHIFT = 8
 MAX_WORK_DAYS_PER_WEEK = 5
 
 class Employee:
-    def __init__(self, name: str):
+    __slots__ = ("name", "preferences", "schedule", "days_worked", "_idx")
+
+    def __init__(self, name: str) -> None:
         self.name = name
-        self.preferences: Dict[int, Shift] = {}  # weekday -> shift
-        self.schedule: Dict[int, Shift] = {}     # weekday -> shift
+        self.preferences = bytearray(7)  # weekday -> shift code (0 = none)
+        self.schedule = bytearray(7)     # weekday -> shift code (0 = none)
         self.days_worked = 0
+        self._idx = -1  # position in the scheduler's roster, set on reset
 
-    def set_preference(self, day: int, shift: Shift):
+    def set_preference(self, day: int, shift: Shift) -> None:
         """Sets the preferred shift for a specific day (0=Monday, 6=Sunday)"""
-        self.preferences[day] = shift
+        self.preferences[day] = shift + 1
 
     def get_preference(self, day: int) -> Optional[Shift]:
         """Returns the preferred shift for a given day"""
-        return self.preferences.get(day)
+        return _CODE_TO_SHIFT[self.preferences[day]]
 
     def can_work_day(self, day: int) -> bool:
         """Checks if employee is available to work on a given day"""
-        # Can't work if already assigned a shift that day
-        if day in self.schedule:
-            return False
-        # Can't work if already at maximum days per week
-        return self.days_worked < MAX_WORK_DAYS_PER_WEEK
+        # Must be free that day and below the maximum days per week
+        return self.schedule[day] == 0 and self.days_worked < MAX_WORK_DAYS_PER_WEEK
 
     def assign_shift(self, day: int, shift: Shift) -> bool:
         """Assigns a shift to the employee for a specific day"""
         if not self.can_work_day(day):
             return False
-        self.schedule[day] = shift
+        self.schedule[day] = shift + 1
         self.days_worked += 1
         return True
 
+    def unassign_shift(self, day: int) -> bool:
+        """Removes the shift assigned to the employee for a specific day"""
+        if self.schedule[day] == 0:
+            return False
+        self.schedule[day] = 0
+        self.days_worked -= 1
+        return True
+
     def get_assigned_shift(self, day: int) -> Optional[Shift]:
         """Returns the assigned shift for a given day"""
-        return self.schedule.get(day)
+        return _CODE_TO_SHIFT[self.schedule[day]]
 
     def has_preference_match(self, day: int) -> bool:
         """Checks if assigned shift matches preference for a day"""
-        assigned_shift = self.get_assigned_shift(day)
-        preferred_shift = self.get_preference(day)
-        return (assigned_shift is not None and
-                preferred_shift is not None and
-                assigned_shift == preferred_shift)
+        assigned_code = self.schedule[day]
+        return assigned_code != 0 and assigned_code == self.preferences[day]
 
-    def reset_schedule(self):
+    def reset_schedule(self) -> None:
         """Clears all shift assignments"""
-        self.schedule = {}
+        self.schedule[:] = bytes(7)
         self.days_worked = 0
 
-    def is_duplicate_name(self, name: str) -> bool:
-        """Checks if the name matches (case-insensitive)"""
-        return self.name.lower() == name.lower()
-
     def get_work_summary(self) -> str:
         """Returns a beautifully formatted string of the employee's work schedule"""
         workload_icon = self._get_workload_icon()
-        summary = f"\n{workload_icon} {self.name} ({self.days_worked}/5 days)\n"
+        parts = [f"\n{workload_icon} {self.name} ({self.days_worked}/5 days)\n"]
 
         days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
         has_assignments = False
         for day_num, day_name in enumerate(days):
-            assigned_shift = self.get_assigned_shift(day_num)
-            if assigned_shift is not None:
-                has_assignments = True
-                shift_icon = assigned_shift._get_shift_icon()
-
-                if self.has_preference_match(day_num):
-                    summary += f"   {shift_icon} {day_name:<10} → {assigned_shift.value} ✨ PREFERRED\n"
-                elif self.get_preference(day_num) is not None:
-                    preferred = self.get_preference(day_num).value
-                    summary += f"   {shift_icon} {day_name:<10} → {assigned_shift.value} (wanted {preferred})\n"
-                else:
-                    summary += f"   {shift_icon} {day_name:<10} → {assigned_shift.value}\n"
+            # Read each day's codes once instead of going through the getters repeatedly
+            assigned_code = self.schedule[day_num]
+            if assigned_code == 0:
+                continue
+
+            has_assignments = True
+            preferred_code = self.preferences[day_num]
+            assigned_shift = _CODE_TO_SHIFT[assigned_code]
+            assert assigned_shift is not None
+            shift_icon = assigned_shift._get_shift_icon()
+
+            if preferred_code == assigned_code:
+                parts.append(f"   {shift_icon} {day_name:<10} → {SHIFT_NAMES[assigned_shift]} ✨ PREFERRED\n")
+            elif preferred_code != 0:
+                preferred = SHIFT_NAMES[preferred_code - 1]
+                parts.append(f"   {shift_icon} {day_name:<10} → {SHIFT_NAMES[assigned_shift]} (wanted {preferred})\n")
+            else:
+                parts.append(f"   {shift_icon} {day_name:<10} → {SHIFT_NAMES[assigned_shift]}\n")
 
         if not has_assignments:
-            summary += "   💤 No shifts assigned\n"
+            parts.append("   💤 No shifts assigned\n")
 
-        return summary
+        return "".join(parts)
 
     def _get_workload_icon(self) -> str:
         """Returns an emoji indicating employee work load"""
-        if self.days_worked == 0:
-            return "😴"
-        elif self.days_worked <= 2:
-            return "😌"
-        elif self.days_worked <= 4:
-            return "😊"
-        elif self.days_worked == 5:
-            return "💪"
-        else:
-            return "🤯"
\ No newline at end of file
+        return _WORKLOAD_ICONS[self.days_worked] if self.days_worked <= 5 else "🤯"
\ No newline at end of file
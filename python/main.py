@@ -1,7 +1,7 @@
 from scheduler import Scheduler
 from employee import MIN_EMPLOYEES_PER_SHIFT, MAX_WORK_DAYS_PER_WEEK
 
-def main():
+def main() -> None:
     scheduler = Scheduler()
 
     print("Employee Scheduling System")
@@ -1,17 +1,33 @@
+import io
 import random
-from typing import Dict, List
-from collections import defaultdict
-from employee import Employee, Shift, MIN_EMPLOYEES_PER_SHIFT, MAX_EMPLOYEES_PER_SHIFT, MAX_WORK_DAYS_PER_WEEK
+import sys
+from typing import List, Set
+from employee import Employee, Shift, SHIFT_ICONS, SHIFT_NAMES, MIN_EMPLOYEES_PER_SHIFT, MAX_EMPLOYEES_PER_SHIFT, MAX_WORK_DAYS_PER_WEEK
+
+SLOT_COUNT = 7 * 3  # days x shifts
+
+def _idx(day: int, shift: Shift) -> int:
+    """Returns the flat slot index for a day and shift"""
+    return day * 3 + shift
 
 class Scheduler:
-    def __init__(self):
+    def __init__(self) -> None:
         self.employees: List[Employee] = []
-        self.schedule: Dict[int, Dict[Shift, List[str]]] = defaultdict(lambda: defaultdict(list))
-        self.days = list(range(7))  # 0=Monday, 6=Sunday
-        self.day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        self.shifts = [Shift.MORNING, Shift.AFTERNOON, Shift.EVENING]
-
-    def add_employee(self):
+        self._name_set: Set[str] = set()  # case-folded names already on the roster
+        self._counts = bytearray(SLOT_COUNT)  # slot -> staff count
+        self.schedule: List[List[List[str]]] = [[[] for _ in range(3)] for _ in range(7)]  # [day][shift] -> names
+        self._avail_mask: List[int] = [0] * 7  # day -> bitmask of employee indices free that day
+        self._open_shifts = bytearray(b"\x07" * 7)  # day -> bitmask of shifts (bit = shift) below max staff
+        self._total_assignments = 0
+        self._staffed_shifts = 0  # shifts with at least the minimum staff
+        self._full_shifts = 0     # shifts at the maximum staff
+        self.days: List[int] = list(range(7))  # 0=Monday, 6=Sunday
+        self.day_names: List[str] = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+        self.shifts: List[Shift] = [Shift.MORNING, Shift.AFTERNOON, Shift.EVENING]
+        self.verbose: bool = False  # report every conflict, rebalance and understaffed shift
+        self._log: List[str] = []  # verbose messages from the current run, printed once at the end
+
+    def add_employee(self) -> None:
         """Interactively adds a new employee with their shift preferences"""
         # Get and validate employee name
         name = input("\n👤 Enter employee name: ").strip()
@@ -20,11 +36,11 @@ class Scheduler:
             print("❌ Name cannot be empty!")
             return
 
-        # Check for duplicate names
-        for emp in self.employees:
-            if emp.is_duplicate_name(name):
-                print(f"❌ Employee '{name}' already exists. Please use a different name.")
-                return
+        # Check for duplicate names (case-insensitive)
+        name_key = name.casefold()
+        if name_key in self._name_set:
+            print(f"❌ Employee '{name}' already exists. Please use a different name.")
+            return
 
         employee = Employee(name)
 
@@ -47,7 +63,7 @@ class Scheduler:
                         shift = self.shifts[preference]
                         employee.set_preference(day_num, shift)
                         shift_icon = shift._get_shift_icon()
-                        print(f"   ✅ Set {shift_icon} {shift.value} preference")
+                        print(f"   ✅ Set {shift_icon} {SHIFT_NAMES[shift]} preference")
                         break
                     else:
                         print("   ❌ Invalid input. Please enter 0, 1, or 2 (or press Enter to skip)")
@@ -55,13 +71,15 @@ class Scheduler:
                     print("   ❌ Invalid input. Please enter 0, 1, or 2 (or press Enter to skip)")
 
         self.employees.append(employee)
+        self._name_set.add(name_key)
         print(f"\n🎉 Employee {name} added successfully!")
         print(f"📊 Total employees: {len(self.employees)}\n")
 
-    def assign_shifts(self):
+    def assign_shifts(self) -> None:
         """Executes the complete scheduling algorithm"""
         print("\n🔄 Generating schedule...")
         print("━" * 50)
+        self._log = []
 
         self._reset_schedules()
         print("✅ Step 1: Reset all schedules")
@@ -72,203 +90,320 @@ class Scheduler:
         self._ensure_minimum_staffing()
         print("✅ Step 3: Ensured minimum staffing")
 
+        if self.verbose:
+            if self._log:
+                sys.stdout.write("\n".join(self._log) + "\n")
+        else:
+            understaffed = SLOT_COUNT - self._staffed_shifts
+            if understaffed:
+                print(f"⚠️  {understaffed} shifts are understaffed (see 'View Schedule' for details)")
+
         print("━" * 50)
         print("🎉 Schedule generated successfully!")
         print(f"📋 {len(self.employees)} employees scheduled across {len(self.days)} days")
         print("💡 Use 'View Schedule' to see the complete weekly schedule.\n")
 
-    def _reset_schedules(self):
+    def _reset_schedules(self) -> None:
         """Clears all employee schedules and the main schedule grid"""
-        for employee in self.employees:
+        for i, employee in enumerate(self.employees):
             employee.reset_schedule()
-
-        self.schedule = defaultdict(lambda: defaultdict(list))
-
-    def _assign_preferred_shifts(self):
+            employee._idx = i
+
+        self._counts[:] = bytes(SLOT_COUNT)
+        self._avail_mask = [(1 << len(self.employees)) - 1] * 7
+        self._open_shifts[:] = b"\x07" * 7
+        self._total_assignments = 0
+        self._staffed_shifts = 0
+        self._full_shifts = 0
+        for day_schedule in self.schedule:
+            for names in day_schedule:
+                names.clear()
+
+    def _assign_preferred_shifts(self) -> None:
         """Assigns employees to their preferred shifts with conflict resolution"""
         for employee in self.employees:
+            # Walk the raw preference codes; days without a preference are 0
             for day in self.days:
                 if employee.days_worked >= MAX_WORK_DAYS_PER_WEEK:
                     break
 
-                preferred_shift = employee.get_preference(day)
-                if preferred_shift is not None:
+                code = employee.preferences[day]
+                if code:
+                    preferred_shift = self.shifts[code - 1]
                     if self._can_assign(employee, day, preferred_shift):
                         self._assign(employee, day, preferred_shift)
                     else:
                         self._resolve_conflict(employee, day, preferred_shift)
 
-    def _resolve_conflict(self, employee: Employee, preferred_day: int, preferred_shift: Shift):
+    def _resolve_conflict(self, employee: Employee, preferred_day: int, preferred_shift: Shift) -> None:
         """Attempts to find alternative assignments when preferred shift is unavailable"""
+        # Only shifts that still have room are considered (see _open_shifts)
+        preferred_bit = 1 << preferred_shift
+
         # Strategy 1: Try alternative shifts on the same day
-        for other_shift in self.shifts:
-            if other_shift != preferred_shift:
-                if self._can_assign(employee, preferred_day, other_shift):
-                    self._assign(employee, preferred_day, other_shift)
-                    day_name = self.day_names[preferred_day]
-                    print(f"🔄 Conflict resolved: {employee.name} → {day_name} {other_shift.value} (preferred shift full)")
-                    return
+        open_shifts = self._open_shifts[preferred_day] & ~preferred_bit
+        if open_shifts and employee.can_work_day(preferred_day):
+            other_shift = self.shifts[(open_shifts & -open_shifts).bit_length() - 1]
+            self._assign(employee, preferred_day, other_shift)
+            if self.verbose:
+                day_name = self.day_names[preferred_day]
+                self._log.append(f"🔄 Conflict resolved: {employee.name} → {day_name} {SHIFT_NAMES[other_shift]} (preferred shift full)")
+            return
 
         # Strategy 2: Try other days
         for other_day in self.days:
-            if other_day == preferred_day:
+            open_shifts = self._open_shifts[other_day]
+            if other_day == preferred_day or not open_shifts or not employee.can_work_day(other_day):
                 continue
 
             # Try preferred shift on this alternative day
-            if self._can_assign(employee, other_day, preferred_shift):
+            if open_shifts & preferred_bit:
                 self._assign(employee, other_day, preferred_shift)
-                day_name = self.day_names[other_day]
-                print(f"🔄 Conflict resolved: {employee.name} → {day_name} {preferred_shift.value} (moved to different day)")
+                if self.verbose:
+                    day_name = self.day_names[other_day]
+                    self._log.append(f"🔄 Conflict resolved: {employee.name} → {day_name} {SHIFT_NAMES[preferred_shift]} (moved to different day)")
                 return
 
-            # Try any available shift on this alternative day
-            for other_shift in self.shifts:
-                if self._can_assign(employee, other_day, other_shift):
-                    self._assign(employee, other_day, other_shift)
-                    day_name = self.day_names[other_day]
-                    print(f"🔄 Conflict resolved: {employee.name} → {day_name} {other_shift.value} (alternative assignment)")
-                    return
+            # Otherwise take the first open shift on this alternative day
+            other_shift = self.shifts[(open_shifts & -open_shifts).bit_length() - 1]
+            self._assign(employee, other_day, other_shift)
+            if self.verbose:
+                day_name = self.day_names[other_day]
+                self._log.append(f"🔄 Conflict resolved: {employee.name} → {day_name} {SHIFT_NAMES[other_shift]} (alternative assignment)")
+            return
 
         # No resolution found
-        print(f"⚠️  Warning: Could not assign {employee.name} anywhere (schedule full)")
+        if self.verbose:
+            self._log.append(f"⚠️  Warning: Could not assign {employee.name} anywhere (schedule full)")
 
     def _can_assign(self, employee: Employee, day: int, shift: Shift) -> bool:
         """Checks if an employee can be assigned to a specific day and shift"""
-        if not employee.can_work_day(day):
-            return False
+        return employee.can_work_day(day) and self._counts[_idx(day, shift)] < MAX_EMPLOYEES_PER_SHIFT
 
-        if len(self.schedule[day][shift]) >= MAX_EMPLOYEES_PER_SHIFT:
-            return False
-
-        return True
-
-    def _assign(self, employee: Employee, day: int, shift: Shift):
+    def _assign(self, employee: Employee, day: int, shift: Shift) -> None:
         """Assigns employee to shift and updates both schedules"""
         if employee.assign_shift(day, shift):
+            idx = _idx(day, shift)
+            count = self._counts[idx] + 1
+            self._counts[idx] = count
             self.schedule[day][shift].append(employee.name)
 
-    def _ensure_minimum_staffing(self):
-        """Fills understaffed shifts to meet minimum requirements"""
+            # Keep the summary statistics current as the shift crosses the min/max thresholds
+            self._total_assignments += 1
+            if count == MIN_EMPLOYEES_PER_SHIFT:
+                self._staffed_shifts += 1
+            if count == MAX_EMPLOYEES_PER_SHIFT:
+                self._full_shifts += 1
+                self._open_shifts[day] &= 0b111 ^ (1 << shift)
+
+            # Clear the employee's availability bit for this day, or for the whole week once maxed out
+            bit = ~(1 << employee._idx)
+            if employee.days_worked >= MAX_WORK_DAYS_PER_WEEK:
+                for d in self.days:
+                    self._avail_mask[d] &= bit
+            else:
+                self._avail_mask[day] &= bit
+
+    def _unassign(self, employee: Employee, day: int) -> None:
+        """Removes employee from their shift on a day and updates both schedules"""
+        shift = employee.get_assigned_shift(day)
+        if shift is not None and employee.unassign_shift(day):
+            idx = _idx(day, shift)
+            count = self._counts[idx] - 1
+            self._counts[idx] = count
+            self.schedule[day][shift].remove(employee.name)
+
+            self._total_assignments -= 1
+            if count == MIN_EMPLOYEES_PER_SHIFT - 1:
+                self._staffed_shifts -= 1
+            if count == MAX_EMPLOYEES_PER_SHIFT - 1:
+                self._full_shifts -= 1
+                self._open_shifts[day] |= 1 << shift
+
+            # Every day the employee is free again becomes available (all of them if they were maxed out)
+            bit = 1 << employee._idx
+            for d in self.days:
+                if employee.can_work_day(d):
+                    self._avail_mask[d] |= bit
+
+    def _ensure_minimum_staffing(self, max_steps: int = 1000) -> None:
+        """Fills understaffed shifts to meet minimum requirements using min-conflicts local search"""
+        understaffed = [(day, shift) for day in self.days for shift in self.shifts
+                        if self._counts[_idx(day, shift)] < MIN_EMPLOYEES_PER_SHIFT]
+
+        for _ in range(max_steps):
+            if not understaffed:
+                break
+
+            # Repair a randomly chosen conflict (understaffed shift)
+            day, shift = random.choice(understaffed)
+            filled = self._fill_shift(day, shift)
+            if not filled or self._counts[_idx(day, shift)] >= MIN_EMPLOYEES_PER_SHIFT:
+                understaffed.remove((day, shift))
+
+        if not self.verbose:
+            return
+
         for day in self.days:
             for shift in self.shifts:
-                current_staff = len(self.schedule[day][shift])
-
+                current_staff = self._counts[_idx(day, shift)]
                 if current_staff < MIN_EMPLOYEES_PER_SHIFT:
-                    needed = MIN_EMPLOYEES_PER_SHIFT - current_staff
-                    available_employees = self._get_available_employees(day)
+                    day_name = self.day_names[day]
+                    self._log.append(f"⚠️  Understaffed: {day_name} {SHIFT_NAMES[shift]} needs {MIN_EMPLOYEES_PER_SHIFT-current_staff} more employees (have {current_staff}/{MIN_EMPLOYEES_PER_SHIFT})")
+
+    def _pick_free_employees(self, available_employees: List[Employee], day: int, shift: Shift, needed: int) -> List[Employee]:
+        """Samples up to `needed` employees, favoring those who asked for this shift"""
+        code = shift + 1
+        preferred = [emp for emp in available_employees if emp.preferences[day] == code]
+        chosen = random.sample(preferred, k=min(needed, len(preferred)))
+        if len(chosen) < needed:
+            others = [emp for emp in available_employees if emp.preferences[day] != code]
+            chosen += random.sample(others, k=min(needed - len(chosen), len(others)))
+        return chosen
+
+    def _fill_shift(self, day: int, shift: Shift) -> bool:
+        """Adds staff to a shift, moving someone from an overstaffed shift if nobody is free"""
+        # Strategy 1: Sample just enough free employees
+        available_employees = self._get_available_employees(day)
+        if available_employees:
+            needed = MIN_EMPLOYEES_PER_SHIFT - self._counts[_idx(day, shift)]
+            for employee in self._pick_free_employees(available_employees, day, shift, needed):
+                self._assign(employee, day, shift)
+            return True
+
+        # Strategy 2: Move an employee out of a shift that has more than the minimum staff,
+        # choosing the move that loses the fewest preferred shifts
+        code = shift + 1
+        best_moves = []
+        best_loss = None
+        for employee in self.employees:
+            if employee.schedule[day] != 0:
+                # Already working this day: only the other shifts that day can donate
+                source_days = [day] if employee.schedule[day] != code else []
+            elif employee.days_worked >= MAX_WORK_DAYS_PER_WEEK:
+                # Free this day but out of days: give up a shift on another day
+                source_days = [d for d in self.days if employee.schedule[d] != 0]
+            else:
+                continue
 
-                    # Randomly shuffle for fair distribution
-                    random.shuffle(available_employees)
+            for source_day in source_days:
+                source_code = employee.schedule[source_day]
+                if self._counts[_idx(source_day, self.shifts[source_code - 1])] <= MIN_EMPLOYEES_PER_SHIFT:
+                    continue
 
-                    assigned = 0
-                    for employee in available_employees:
-                        if assigned >= needed:
-                            break
+                loss = ((employee.preferences[source_day] == source_code) -
+                        (employee.preferences[day] == code))
+                if best_loss is None or loss < best_loss:
+                    best_loss = loss
+                    best_moves = [(employee, source_day)]
+                elif loss == best_loss:
+                    best_moves.append((employee, source_day))
 
-                        if self._can_assign(employee, day, shift):
-                            self._assign(employee, day, shift)
-                            assigned += 1
+        if not best_moves:
+            return False
 
-                    if assigned < needed:
-                        day_name = self.day_names[day]
-                        print(f"⚠️  Understaffed: {day_name} {shift.value} needs {needed-assigned} more employees (have {current_staff+assigned}/{MIN_EMPLOYEES_PER_SHIFT})")
+        employee, source_day = random.choice(best_moves)
+        source_shift = self.shifts[employee.schedule[source_day] - 1]
+        self._unassign(employee, source_day)
+        self._assign(employee, day, shift)
+        if self.verbose:
+            self._log.append(f"🔄 Rebalanced: {employee.name} → {self.day_names[day]} {SHIFT_NAMES[shift]} (moved from {self.day_names[source_day]} {SHIFT_NAMES[source_shift]})")
+        return True
 
     def _get_available_employees(self, day: int) -> List[Employee]:
         """Returns employees who can work on the specified day"""
-        return [emp for emp in self.employees if emp.can_work_day(day)]
-
-    def print_schedule(self):
+        available = []
+        mask = self._avail_mask[day]
+        while mask:
+            low_bit = mask & -mask
+            available.append(self.employees[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return available
+
+    def print_schedule(self) -> None:
         """Displays the complete weekly schedule and employee summaries"""
         if not self.employees:
             print("\n📝 No employees added yet! Please add some employees first.")
             return
 
-        self._print_schedule_header()
-        self._print_weekly_grid()
-        self._print_schedule_footer()
-        self._print_employee_summaries()
+        # Render into one buffer and write it out in a single call
+        buf = io.StringIO()
+        self._print_schedule_header(buf)
+        self._print_weekly_grid(buf)
+        self._print_schedule_footer(buf)
+        self._print_employee_summaries(buf)
+        sys.stdout.write(buf.getvalue())
 
-    def _print_schedule_header(self):
+    def _print_schedule_header(self, buf: io.StringIO) -> None:
         """Displays the main schedule title"""
-        print("\n" + "═" * 90)
-        print("📅                         WEEKLY EMPLOYEE SCHEDULE                          📅")
-        print("═" * 90)
+        buf.write("\n" + "═" * 90 + "\n")
+        buf.write("📅                         WEEKLY EMPLOYEE SCHEDULE                          📅\n")
+        buf.write("═" * 90 + "\n")
 
-    def _print_weekly_grid(self):
+    def _print_weekly_grid(self, buf: io.StringIO) -> None:
         """Displays the main schedule in a clean tabular format"""
         for day_num, day_name in enumerate(self.day_names):
-            print(f"\n📅 {day_name.upper()}")
-            print("─" * 85)
+            buf.write(f"\n📅 {day_name.upper()}\n")
+            buf.write("─" * 85 + "\n")
 
             for shift in self.shifts:
                 employees = self.schedule[day_num][shift]
                 staff_count = len(employees)
 
                 shift_icon = self._get_shift_icon(shift)
-                print(f"   {shift_icon} {shift.value:<10} | ", end="")
+                buf.write(f"   {shift_icon} {SHIFT_NAMES[shift]:<10} | ")
 
                 if staff_count == 0:
-                    print(f"{'No employees assigned':<50}", end="")
+                    buf.write(f"{'No employees assigned':<50}")
                     if staff_count < MIN_EMPLOYEES_PER_SHIFT:
-                        print(f" 🚨 UNDERSTAFFED (need {MIN_EMPLOYEES_PER_SHIFT})", end="")
+                        buf.write(f" 🚨 UNDERSTAFFED (need {MIN_EMPLOYEES_PER_SHIFT})")
                 else:
-                    employee_list = ", ".join(employees)
-                    if len(employee_list) > 45:
+                    # Only join names up to the point where the line gets truncated
+                    shown = []
+                    list_length = -2
+                    for name in employees:
+                        shown.append(name)
+                        list_length += len(name) + 2
+                        if list_length > 45:
+                            break
+
+                    employee_list = ", ".join(shown)
+                    if list_length > 45:
                         employee_list = employee_list[:42] + "..."
-                    print(f"{employee_list:<50}", end="")
+                    buf.write(f"{employee_list:<50}")
 
                     # Status indicator
                     if staff_count < MIN_EMPLOYEES_PER_SHIFT:
-                        print(f" 🚨 UNDERSTAFFED ({staff_count}/{MIN_EMPLOYEES_PER_SHIFT})", end="")
+                        buf.write(f" 🚨 UNDERSTAFFED ({staff_count}/{MIN_EMPLOYEES_PER_SHIFT})")
                     elif staff_count < MAX_EMPLOYEES_PER_SHIFT:
-                        print(f" ✅ STAFFED ({staff_count}/{MAX_EMPLOYEES_PER_SHIFT})", end="")
+                        buf.write(f" ✅ STAFFED ({staff_count}/{MAX_EMPLOYEES_PER_SHIFT})")
                     else:
-                        print(f" 🏆 FULL ({staff_count}/{MAX_EMPLOYEES_PER_SHIFT})", end="")
-                print()
+                        buf.write(f" 🏆 FULL ({staff_count}/{MAX_EMPLOYEES_PER_SHIFT})")
+                buf.write("\n")
 
-    def _print_schedule_footer(self):
+    def _print_schedule_footer(self, buf: io.StringIO) -> None:
         """Displays summary statistics"""
-        print("\n" + "═" * 90)
+        buf.write("\n" + "═" * 90 + "\n")
 
         total_shifts = len(self.days) * len(self.shifts)
-        staffed_shifts = 0
-        full_shifts = 0
-        total_assignments = 0
+        buf.write(f"📊 SCHEDULE STATS: {self._staffed_shifts}/{total_shifts} shifts properly staffed │ {self._full_shifts} full shifts │ {self._total_assignments} total assignments\n")
+        buf.write("═" * 90 + "\n")
 
-        for day in self.days:
-            for shift in self.shifts:
-                count = len(self.schedule[day][shift])
-                total_assignments += count
-                if count >= MIN_EMPLOYEES_PER_SHIFT:
-                    staffed_shifts += 1
-                if count == MAX_EMPLOYEES_PER_SHIFT:
-                    full_shifts += 1
-
-        print(f"📊 SCHEDULE STATS: {staffed_shifts}/{total_shifts} shifts properly staffed │ {full_shifts} full shifts │ {total_assignments} total assignments")
-        print("═" * 90)
-
-    def _print_employee_summaries(self):
+    def _print_employee_summaries(self, buf: io.StringIO) -> None:
         """Displays individual employee work schedules"""
-        print("\n👥 EMPLOYEE WORK SUMMARIES")
-        print("─" * 60)
+        buf.write("\n👥 EMPLOYEE WORK SUMMARIES\n")
+        buf.write("─" * 60 + "\n")
 
         for i, employee in enumerate(self.employees):
-            print(employee.get_work_summary(), end="")
+            buf.write(employee.get_work_summary())
             if i < len(self.employees) - 1:
-                print()
+                buf.write("\n")
 
-        print("─" * 60)
+        buf.write("─" * 60 + "\n")
 
     def _get_shift_icon(self, shift: Shift) -> str:
         """Returns an emoji icon for each shift type"""
-        if shift == Shift.MORNING:
-            return "🌅"
-        elif shift == Shift.AFTERNOON:
-            return "☀️"
-        elif shift == Shift.EVENING:
-            return "🌙"
-        else:
-            return "⏰"
+        return SHIFT_ICONS.get(shift, "⏰")
 
     def get_employee_count(self) -> int:
         """Returns the total number of employees"""
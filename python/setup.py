@@ -0,0 +1,15 @@
+"""Optional ahead-of-time build of the scheduler modules with mypyc.
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+The compiled employee/scheduler extensions are picked up by `python main.py`
+in place of the .py sources; delete the generated .so files to go back.
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="employee-scheduler",
+    ext_modules=mypycify(["employee.py", "scheduler.py"]),
+)